@@ -1,26 +1,49 @@
 
 
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend; avoids importing a GUI toolkit
 import matplotlib.pyplot as plt
 import numpy as np
+import argparse
+import functools
+import hashlib
+import io
 import os
-from tqdm import tqdm
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 from matplotlib.lines import Line2D
+from matplotlib.collections import LineCollection
+from PIL import Image
 
 # Create output directory for plots
-os.makedirs('fig5_plots', exist_ok=True)
+OUTPUT_DIR = Path('fig5_plots')
+OUTPUT_DIR.mkdir(exist_ok=True)
+OUTPUT_FORMATS = ['pdf', 'svg', 'png']  # Vector formats first: the figure is all line art
 
 # Figure dimensions for the entire grid
 GRID_DIMENSIONS = (16, 12)  # Large figure to accommodate 3x4 grid
+GRID_ROWS, GRID_COLS = 3, 4
+GRID_DPI = 200
+TITLE_SPACE = 0.2  # Inches of padding around each subplot, leaving room for its title
+
+# Subplot labels, column titles and row titles
+SUBPLOT_LABELS = ['(a)', '(b)', '(c)', '(d)', '(e)', '(f)', '(g)', '(h)', '(i)', '(j)', '(k)', '(l)']
+COL_TITLES = ['20 Keys', '100 Keys', '1000 Keys', '100% Local']
+ROW_TITLES = ['5 Nodes', '10 Nodes', '20 Nodes']
 
 # Configuration based on the paper
-NUM_NODES = [5, 10, 20]
+NUM_NODES = np.array([5, 10, 20], dtype=np.int32)
 CONTENTION_LEVELS = {
     'high': 20,      # 20 locks (keys)
     'medium': 100,   # 100 locks (keys)
     'low': 1000      # 1000 locks (keys)
 }
-LOCALITY_PERCENTAGES = [85, 90, 95]  # For columns 1-3
-THREADS_PER_NODE = [2, 4, 6, 8, 10, 12]  # X-axis values (matching paper: 2, 4, 6, 8, 10, 12)
+LOCALITY_PERCENTAGES = np.array([85, 90, 95], dtype=np.int32)  # For columns 1-3
+ALL_LOCALITIES = np.append(LOCALITY_PERCENTAGES, np.int32(100))  # Column 4 is 100% local
+THREADS_PER_NODE = np.array([2, 4, 6, 8, 10, 12], dtype=np.int32)  # X-axis values (matching paper: 2, 4, 6, 8, 10, 12)
+
+# Set random seed for reproducibility
+RANDOM_SEED = 42
 
 # System names (matching paper: ALock, MCS, Spin)
 SYSTEMS = ['ALock', 'MCS', 'Spin']
@@ -40,249 +63,370 @@ SYSTEM_STYLE_COL4 = {
     'Spin': ('orange', 'x', ':')         # Light orange, x, dotted
 }
 
-# Locality line styles (for columns 1-3)
-LOCALITY_STYLES = {
-    85: '-',   # Solid
-    90: '--',  # Dashed
-    95: ':'    # Dotted
+# Line and marker styles per curve: dotted='s', dashed='x', solid=original
+# Format: (linestyle, marker or None to keep the system marker, marker_edgewidth)
+# Locality styles (for columns 1-3)
+LOCALITY_PLOT_STYLE = {
+    85: ('-', None, 1),    # Solid, original marker
+    90: ('--', 'x', 2),    # Dashed, bold X markers
+    95: (':', 's', 1)      # Dotted, square
+}
+
+# Contention styles (for column 4)
+CONTENTION_PLOT_STYLE = {
+    'high': ('-', None, 1),    # Solid (20 keys)
+    'medium': ('--', 'x', 2),  # Dashed (100 keys)
+    'low': (':', 's', 1)       # Dotted (1000 keys)
+}
+
+# Styles per varying axis: (system styles, per-level plot styles)
+SUBPLOT_STYLES = {
+    'locality': (SYSTEM_STYLE_COLS1_3, LOCALITY_PLOT_STYLE),
+    'contention': (SYSTEM_STYLE_COL4, CONTENTION_PLOT_STYLE)
 }
 
-# Contention line styles (for column 4)
-CONTENTION_STYLES = {
-    'high': '-',     # Solid (20 keys)
-    'medium': '--',  # Dashed (100 keys)
-    'low': ':'       # Dotted (1000 keys)
+# What each grid column plots: (varying axis, fixed contention or locality)
+COLUMN_SPECS = [
+    ('locality', 'high'),      # 20 Keys
+    ('locality', 'medium'),    # 100 Keys
+    ('locality', 'low'),       # 1000 Keys
+    ('contention', 100)        # 100% Local
+]
+
+# Axes chrome shared by all 12 subplots, applied once for the whole grid
+# (Match advisor's style: light dashed grid, smaller tick labels)
+AXES_STYLE = {
+    'axes.grid': True,
+    'grid.alpha': 0.3,
+    'grid.linestyle': '--',
+    'axes.labelsize': 10,
+    'xtick.labelsize': 9,
+    'ytick.labelsize': 9
+}
+
+# Synthetic model parameters per system
+# Format: (base_throughput, thread_slope, locality_slope, local_100_factor,
+#          contention_factors (high, medium, low), degradation_cutoff, degradation_slope)
+SYSTEM_PARAMS = {
+    'ALock': (500000, 0.15, 0.02, 1.3, (1.2, 1.0, 0.85), 100, 0.001),
+    'MCS': (200000, 0.12, 0.01, 0.1, (0.6, 0.9, 1.0), 80, 0.002),      # Very low for 100% local
+    'Spin': (150000, 0.08, 0.005, 0.05, (0.4, 0.7, 0.9), 40, 0.003)    # Very low for 100% local
 }
 
-def generate_synthetic_throughput(system, num_threads, num_nodes, contention, locality):
+def generate_synthetic_throughput():
     """
-    Generate synthetic throughput data based on the paper's findings.
+    Generate noise-free synthetic throughput data based on the paper's findings.
+    Returns an array indexed as [system, nodes, contention, locality, threads],
+    following the order of SYSTEMS, NUM_NODES, CONTENTION_LEVELS,
+    ALL_LOCALITIES and THREADS_PER_NODE.
     """
-    total_threads = num_threads * num_nodes
+    params = [SYSTEM_PARAMS[system] for system in SYSTEMS]
+    base_throughput, thread_slope, locality_slope, local_100_factor, _, cutoff, degradation_slope = (
+        np.array([p[i] for p in params], dtype=np.float32) for i in range(7)
+    )
+    contention_factors = np.array([p[4] for p in params], dtype=np.float32)  # (systems, contention)
     
-    if system == 'ALock':
-        base_throughput = 500000
-        thread_factor = 1.0 + (num_threads - 1) * 0.15
-        locality_factor = 1.0 + (locality - 85) * 0.02 if locality < 100 else 1.3
-        if contention == 'high':
-            contention_factor = 1.2
-        elif contention == 'medium':
-            contention_factor = 1.0
-        else:
-            contention_factor = 0.85
-        
-        if total_threads > 100:
-            degradation = 1.0 - (total_threads - 100) * 0.001
-        else:
-            degradation = 1.0
-        
-        throughput = base_throughput * thread_factor * locality_factor * contention_factor * degradation
-        
-    elif system == 'MCS':
-        base_throughput = 200000
-        thread_factor = 1.0 + (num_threads - 1) * 0.12
-        locality_factor = 1.0 + (locality - 85) * 0.01 if locality < 100 else 0.1  # Very low for 100% local
-        if contention == 'high':
-            contention_factor = 0.6
-        elif contention == 'medium':
-            contention_factor = 0.9
-        else:
-            contention_factor = 1.0
-        
-        if total_threads > 80:
-            degradation = 1.0 - (total_threads - 80) * 0.002
-        else:
-            degradation = 1.0
-        
-        throughput = base_throughput * thread_factor * locality_factor * contention_factor * degradation
-        
-    else:  # Spin
-        base_throughput = 150000
-        thread_factor = 1.0 + (num_threads - 1) * 0.08
-        locality_factor = 1.0 + (locality - 85) * 0.005 if locality < 100 else 0.05  # Very low for 100% local
-        if contention == 'high':
-            contention_factor = 0.4
-        elif contention == 'medium':
-            contention_factor = 0.7
-        else:
-            contention_factor = 0.9
-        
-        if total_threads > 40:
-            degradation = 1.0 - (total_threads - 40) * 0.003
-        else:
-            degradation = 1.0
-        
-        throughput = base_throughput * thread_factor * locality_factor * contention_factor * degradation
+    # Per-axis vectors, shaped to broadcast over (system, nodes, contention, locality, threads)
+    per_system = (slice(None), None, None, None, None)
+    threads = THREADS_PER_NODE.astype(np.float32)[None, None, None, None, :]
+    nodes = NUM_NODES.astype(np.float32)[None, :, None, None, None]
+    locality = ALL_LOCALITIES.astype(np.float32)[None, :]
+    total_threads = threads * nodes
     
-    # Add realistic noise
-    noise = np.random.normal(1.0, 0.05)
-    throughput = max(0, throughput * noise)
+    thread_factor = 1.0 + (threads - 1) * thread_slope[per_system]
+    locality_factor = np.where(
+        locality < 100,
+        1.0 + (locality - 85) * locality_slope[:, None],
+        local_100_factor[:, None]
+    )[:, None, None, :, None]
+    contention_factor = contention_factors[:, None, :, None, None]
+    degradation = np.where(
+        total_threads > cutoff[per_system],
+        1.0 - (total_threads - cutoff[per_system]) * degradation_slope[per_system],
+        1.0
+    )
+    
+    throughput = base_throughput[per_system] * thread_factor * locality_factor * contention_factor * degradation
     
     return throughput
 
-def create_subplot_cols1_3(ax, num_nodes, contention):
+@functools.lru_cache(maxsize=None)
+def get_throughput():
     """
-    Create subplot for columns 1-3 (20, 100, 1000 keys with locality variations).
-    Shows 3 systems × 3 locality levels = 9 lines.
+    Return the noisy throughput for every (system, nodes, contention, locality, threads)
+    combination. Computed on first use and cached, so every subplot shares one
+    deterministic core and one noise draw. The array is read-only because
+    every caller gets the same object.
     """
-    for system in SYSTEMS:
-        color, marker, _ = SYSTEM_STYLE_COLS1_3[system]
-        
-        for locality in LOCALITY_PERCENTAGES:
-            threads_list = []
-            throughput_list = []
-            
-            for num_threads in THREADS_PER_NODE:
-                throughput = generate_synthetic_throughput(
-                    system, num_threads, num_nodes, contention, locality
-                )
-                threads_list.append(num_threads)
-                throughput_list.append(throughput)
-            
-            linestyle = LOCALITY_STYLES[locality]
-            label = f'{system} {locality}%' if system == SYSTEMS[0] else None
-            
-            # Set marker based on linestyle: dotted='s', dashed='x', solid=original
-            if linestyle == ':':  # Dotted line
-                plot_marker = 's'  # Square
-                marker_edgewidth = 1
-            elif linestyle == '--':  # Dashed line
-                plot_marker = 'x'  # X
-                marker_edgewidth = 2  # Bold X markers
-            else:  # Solid line
-                plot_marker = marker  # Keep original marker
-                marker_edgewidth = 1
-            
-            # Match advisor's style: thicker lines, larger markers
-            ax.plot(
-                threads_list,
-                throughput_list,
-                color=color,
-                marker=plot_marker,
-                linestyle=linestyle,
-                linewidth=2,  # Thicker lines like advisor's style
-                markersize=6,  # Larger markers
-                markeredgewidth=marker_edgewidth,
-                label=label
-            )
+    rng = np.random.default_rng(RANDOM_SEED)
+    throughput = generate_synthetic_throughput()
     
-    ax.set_xlabel('Threads per Node', fontsize=10)
-    ax.set_ylabel('Throughput (ops/s)', fontsize=10, labelpad=15)  # Add padding to prevent overlap
-    ax.grid(True, alpha=0.3, linestyle='--')
-    ax.set_xlim(left=0, right=12)
-    ax.set_ylim(bottom=0)
-    ax.set_xticks([0, 4, 8, 12])  # Show major ticks, but plot all 12 points
+    # Add realistic noise (drawn for the whole grid in one call)
+    noise = 1.0 + 0.05 * rng.standard_normal(size=throughput.shape, dtype=np.float32)  # normal(1.0, 0.05)
+    throughput = np.maximum(0, throughput * noise)
+    throughput.setflags(write=False)
+    return throughput
+
+def plot_curves(ax, throughputs, colors, linestyles, markers, marker_edgewidths):
+    """
+    Draw all curves of a subplot as one LineCollection plus one scatter per marker shape.
+    `throughputs` has one row per curve, sampled at THREADS_PER_NODE.
+    """
+    threads = THREADS_PER_NODE.astype(np.float32)
+    throughputs = np.asarray(throughputs, dtype=np.float32)
+    segments = np.empty((len(throughputs), len(threads), 2), dtype=np.float32)
+    segments[:, :, 0] = threads
+    segments[:, :, 1] = throughputs
     
-    # Match advisor's style: adjust tick parameters
-    ax.tick_params(axis='both', which='major', labelsize=9)
+    # Match advisor's style: thicker lines, larger markers
+    lines = LineCollection(
+        segments,
+        colors=colors,
+        linestyles=linestyles,
+        linewidths=2  # Thicker lines like advisor's style
+    )
+    ax.add_collection(lines)
     
-    return ax
+    # scatter takes a single marker shape, so group the curves by marker
+    markers = np.asarray(markers)
+    for plot_marker in dict.fromkeys(markers):
+        mask = markers == plot_marker
+        ax.scatter(
+            np.tile(threads, mask.sum()),
+            throughputs[mask].ravel(),
+            c=np.repeat(np.asarray(colors)[mask], len(threads)),
+            marker=plot_marker,
+            s=36,  # Larger markers (markersize 6)
+            linewidths=np.repeat(np.asarray(marker_edgewidths)[mask], len(threads)),
+            zorder=3
+        )
+    
+    ax.autoscale_view()
 
-def create_subplot_col4(ax, num_nodes):
+def create_subplot(ax, node_idx, varying_axis, fixed):
     """
-    Create subplot for column 4 (100% Local with contention variations).
-    Shows 3 systems × 3 contention levels = 9 lines.
+    Create one subplot: 3 systems × 3 levels of `varying_axis` = 9 lines.
+    `node_idx` indexes NUM_NODES.
+    varying_axis='locality': columns 1-3 (20, 100, 1000 keys), `fixed` is the contention.
+    varying_axis='contention': column 4 (100% Local), `fixed` is the locality.
     """
-    for system in SYSTEMS:
-        color, marker, _ = SYSTEM_STYLE_COL4[system]
-        
-        for contention in ['high', 'medium', 'low']:
-            threads_list = []
-            throughput_list = []
-            
-            for num_threads in THREADS_PER_NODE:
-                throughput = generate_synthetic_throughput(
-                    system, num_threads, num_nodes, contention, 100  # 100% local
-                )
-                threads_list.append(num_threads)
-                throughput_list.append(throughput)
-            
-            linestyle = CONTENTION_STYLES[contention]
-            label = f'{system} {CONTENTION_LEVELS[contention]}' if system == SYSTEMS[0] else None
-            
-            # Set marker based on linestyle: dotted='s', dashed='x', solid=original
-            if linestyle == ':':  # Dotted line
-                plot_marker = 's'  # Square
-                marker_edgewidth = 1
-            elif linestyle == '--':  # Dashed line
-                plot_marker = 'x'  # X
-                marker_edgewidth = 2  # Bold X markers
-            else:  # Solid line
-                plot_marker = marker  # Keep original marker
-                marker_edgewidth = 1
-            
-            # Match advisor's style: thicker lines, larger markers
-            ax.plot(
-                threads_list,
-                throughput_list,
-                color=color,
-                marker=plot_marker,
-                linestyle=linestyle,
-                linewidth=2,  # Thicker lines like advisor's style
-                markersize=6,  # Larger markers
-                markeredgewidth=marker_edgewidth,
-                label=label
-            )
+    system_styles, plot_styles = SUBPLOT_STYLES[varying_axis]
+    node_data = get_throughput()[:, node_idx]  # [system, contention, locality, threads]
+    
+    # Levels in the same order as the matching tensor axis
+    if varying_axis == 'locality':
+        levels = LOCALITY_PERCENTAGES.tolist()
+        cont_idx = list(CONTENTION_LEVELS).index(fixed)
+        subplot_data = node_data[:, cont_idx, :len(LOCALITY_PERCENTAGES)]
+    else:
+        levels = list(CONTENTION_LEVELS)
+        subplot_data = node_data[:, :, ALL_LOCALITIES.tolist().index(fixed)]
     
-    ax.set_xlabel('Threads per Node', fontsize=10)
-    ax.set_ylabel('Throughput (ops/s)', fontsize=10, labelpad=15)  # Add padding to prevent overlap
-    ax.grid(True, alpha=0.3, linestyle='--')
+    # One curve per (system, level), systems outermost: flatten the data the same way
+    throughputs = subplot_data.reshape(-1, len(THREADS_PER_NODE))
+    level_styles = [plot_styles[level] for level in levels]
+    curve_styles = [(system_styles[system], level_style) for system in SYSTEMS for level_style in level_styles]
+    
+    colors = [color for (color, _, _), _ in curve_styles]
+    linestyles = [linestyle for _, (linestyle, _, _) in curve_styles]
+    markers = [plot_marker or marker for (_, marker, _), (_, plot_marker, _) in curve_styles]
+    marker_edgewidths = [marker_edgewidth for _, (_, _, marker_edgewidth) in curve_styles]
+    
+    plot_curves(ax, throughputs, colors, linestyles, markers, marker_edgewidths)
+    
+    ax.set_xlabel('Threads per Node')
+    ax.set_ylabel('Throughput (ops/s)', labelpad=15)  # Add padding to prevent overlap
+    
+    return ax
+
+def set_thread_axis(ax):
+    """
+    Set the threads-per-node x-axis range and ticks. Axes created with
+    sharex share this, so it only needs to be set once per shared group.
+    """
     ax.set_xlim(left=0, right=12)
-    ax.set_ylim(bottom=0)
     ax.set_xticks([0, 4, 8, 12])  # Show major ticks, but plot all 12 points
-    
-    # Match advisor's style: adjust tick parameters
-    ax.tick_params(axis='both', which='major', labelsize=9)
+
+def set_throughput_axis(ax, node_idx):
+    """
+    Set the throughput y-axis of a grid row: from zero up to the row's data
+    plus the usual autoscale margin. Computed from the data rather than the
+    drawn artists, so a standalone tile gets the same limits as the shared row.
+    """
+    # The four columns together plot every contention and locality of this node count
+    row_data = get_throughput()[:, node_idx].astype(float)
+    low, high = row_data.min(), row_data.max()
+    ax.set_ylim(bottom=0, top=high + plt.rcParams['axes.ymargin'] * (high - low))
+
+def hide_inner_labels(ax, row_idx, col_idx):
+    """
+    Match ax.label_outer() on a grid for a standalone tile: only the bottom row
+    keeps x labels and tick labels, only the leftmost column keeps y ones.
+    Hidden labels are made transparent rather than removed, so every tile
+    reserves the same space and its axes (and overlaid title) line up.
+    """
+    if row_idx < GRID_ROWS - 1:
+        ax.xaxis.label.set_color('none')
+        ax.tick_params(axis='x', labelcolor='none')
+    if col_idx > 0:
+        ax.yaxis.label.set_color('none')
+        ax.tick_params(axis='y', labelcolor='none')
+        ax.yaxis.get_offset_text().set_color('none')
+
+def write_output(save_path, data):
+    """
+    Atomically write rendered image bytes to `save_path`, so an interrupted
+    run never leaves a truncated figure behind.
+    """
+    tmp_path = save_path.with_name(save_path.name + '.tmp')
+    tmp_path.write_bytes(data)
+    tmp_path.replace(save_path)
+
+def config_hash(tiled):
+    """
+    Hash everything that affects the rendered figure, so an unchanged
+    configuration can skip rendering: this script's source (all constants,
+    model code and inline styles), the Matplotlib and NumPy versions, and
+    the render mode. `tiled` is True when the grid is assembled from
+    separately rendered tiles (--jobs > 1).
+    """
+    key = hashlib.blake2b(Path(__file__).read_bytes())
+    key.update(repr((matplotlib.__version__, np.__version__, tiled)).encode())
+    return key.hexdigest()
+
+def output_path(fmt):
+    """
+    Return the path of the Figure 5 grid in the given output format.
+    """
+    return OUTPUT_DIR / f'figure5_grid.{fmt}'
+
+def hash_path(save_path):
+    """
+    Return the path storing the hash of the config `save_path` was rendered from.
+    """
+    return save_path.with_name(save_path.name + '.sha')
+
+def is_up_to_date(save_path, key):
+    """
+    Return True if `save_path` was rendered from the configuration hashed as `key`.
+    """
+    key_path = hash_path(save_path)
+    return save_path.exists() and key_path.exists() and key_path.read_text().strip() == key
+
+def create_cell(ax, row_idx, col_idx):
+    """
+    Draw the data of one cell of the Figure 5 grid.
+    Columns = contention, Rows = nodes (3 plots per column).
+    """
+    varying_axis, fixed = COLUMN_SPECS[col_idx]
+    create_subplot(ax, row_idx, varying_axis, fixed)  # Rows follow NUM_NODES
     
     return ax
 
-def create_figure5_grid():
+def add_cell_text(fig, cells):
+    """
+    Overlay subplot labels and titles for each (ax, row_idx, col_idx) in `cells`
+    as figure text. The layout is solved once and then frozen so the text
+    positions, computed from the final axes positions, stay valid.
+    """
+    fig.draw_without_rendering()
+    fig.set_layout_engine('none')
+    
+    fig_height = fig.get_figheight()
+    title_pad = 10 / 72 / fig_height  # 10 pt above the axes, in figure fraction
+    
+    for ax, row_idx, col_idx in cells:
+        pos = ax.get_position()
+        
+        # Add subplot label (labels run down each column)
+        fig.text(pos.x0 + 0.02 * pos.width, pos.y0 + 0.98 * pos.height,
+                 SUBPLOT_LABELS[col_idx * GRID_ROWS + row_idx],
+                 fontsize=12, fontweight='bold', verticalalignment='top')
+        
+        # Add titles at top of each plot: "20 Keys, 5 Nodes" format
+        fig.text(pos.x0 + pos.width / 2, pos.y1 + title_pad,
+                 f'{COL_TITLES[col_idx]}, {ROW_TITLES[row_idx]}',
+                 ha='center', fontsize=11, fontweight='bold')
+
+def create_figure5_grid(fmt='pdf'):
     """
     Create the complete Figure 5 grid layout (3x4 = 12 subplots).
+    Vector formats (pdf, svg) write draw commands directly and skip the large
+    raster buffer that PNG output needs.
+    """
+    with plt.rc_context(AXES_STYLE):
+        fig, axes = plt.subplots(GRID_ROWS, GRID_COLS, figsize=GRID_DIMENSIONS,
+                                 sharex=True, sharey='row', constrained_layout=True)
+        fig.get_layout_engine().set(h_pad=TITLE_SPACE)  # Leave room for the overlaid titles
+        
+        # Structure: 3 rows (5, 10, 20 nodes) × 4 columns (20 Keys, 100 Keys, 1000 Keys, 100% Local)
+        cells = [(axes[row_idx, col_idx], row_idx, col_idx)
+                 for col_idx in range(GRID_COLS) for row_idx in range(GRID_ROWS)]
+        for ax, row_idx, col_idx in cells:
+            create_cell(ax, row_idx, col_idx)
+        set_thread_axis(axes[0, 0])  # Shared by every subplot
+        for node_idx, row_axes in enumerate(axes):
+            set_throughput_axis(row_axes[0], node_idx)  # Shared along each row
+        
+        # Only label the outer edges of the grid; shared axes already hide inner tick labels
+        for ax in axes.flat:
+            ax.label_outer()
+        add_cell_text(fig, cells)
+        
+        # No overall title (removed as requested)
+        # constrained_layout already sized the grid, so render once to memory with no tight bbox pass
+        buf = io.BytesIO()
+        fig.savefig(buf, format=fmt, dpi=GRID_DPI, bbox_inches=None)
+        plt.close(fig)
+    
+    save_path = output_path(fmt)
+    write_output(save_path, buf.getvalue())
+    
+    return save_path
+
+def render_tile(cell):
     """
-    fig, axes = plt.subplots(3, 4, figsize=GRID_DIMENSIONS)
+    Render a single grid cell as a standalone figure and return it as PNG bytes.
+    Runs in a worker process, so each call owns its Figure.
+    """
+    row_idx, col_idx = cell
+    tile_size = (GRID_DIMENSIONS[0] / GRID_COLS, GRID_DIMENSIONS[1] / GRID_ROWS)
     
-    # Subplot labels
-    labels = ['(a)', '(b)', '(c)', '(d)', '(e)', '(f)', '(g)', '(h)', '(i)', '(j)', '(k)', '(l)']
-    label_idx = 0
+    with plt.rc_context(AXES_STYLE):
+        fig, ax = plt.subplots(figsize=tile_size, constrained_layout=True)
+        fig.get_layout_engine().set(h_pad=TITLE_SPACE)  # Leave room for the overlaid title
+        create_cell(ax, row_idx, col_idx)
+        set_thread_axis(ax)
+        set_throughput_axis(ax, row_idx)  # Same limits as the shared row in the single-figure grid
+        hide_inner_labels(ax, row_idx, col_idx)
+        add_cell_text(fig, [(ax, row_idx, col_idx)])
+        
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png', dpi=GRID_DPI, bbox_inches=None)
+        plt.close(fig)
     
-    # Column titles
-    col_titles = ['20 Keys', '100 Keys', '1000 Keys', '100% Local']
+    return buf.getvalue()
+
+def create_figure5_tiles(jobs):
+    """
+    Create the Figure 5 grid by rendering each cell in a separate process
+    and pasting the resulting PNG tiles together.
+    """
+    cells = [(row_idx, col_idx) for row_idx in range(GRID_ROWS) for col_idx in range(GRID_COLS)]
     
-    # Row titles (will be added as y-labels on leftmost plots)
-    row_titles = ['5 Nodes', '10 Nodes', '20 Nodes']
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        tiles = list(executor.map(render_tile, cells))
     
-    # Create each subplot - Columns = contention, Rows = nodes (3 plots per column)
-    # Structure: 3 rows (5, 10, 20 nodes) × 4 columns (20 Keys, 100 Keys, 1000 Keys, 100% Local)
-    for col_idx in range(4):
-        for row_idx, num_nodes in enumerate(NUM_NODES):
-            ax = axes[row_idx, col_idx]  # row_idx = 0,1,2 (3 rows), col_idx = 0,1,2,3 (4 columns)
-            
-            if col_idx < 3:  # Columns 1-3: contention with locality variations
-                contention = ['high', 'medium', 'low'][col_idx]
-                create_subplot_cols1_3(ax, num_nodes, contention)
-            else:  # Column 4: 100% Local with contention variations
-                create_subplot_col4(ax, num_nodes)
-            
-            # Only show Y-axis label on leftmost column to avoid overlap
-            if col_idx > 0:
-                ax.set_ylabel('')  # Remove Y-axis label for non-leftmost columns
-            
-            # Add subplot label
-            ax.text(0.02, 0.98, labels[label_idx], transform=ax.transAxes,
-                   fontsize=12, fontweight='bold', verticalalignment='top')
-            label_idx += 1
-            
-            # Add titles at top of each plot: "20 Keys, 5 Nodes" format
-            ax.set_title(f'{col_titles[col_idx]}, {row_titles[row_idx]}', 
-                       fontsize=11, fontweight='bold', pad=10)
+    tiles = [Image.open(io.BytesIO(tile)) for tile in tiles]
+    tile_width, tile_height = tiles[0].size
+    grid = Image.new('RGBA', (tile_width * GRID_COLS, tile_height * GRID_ROWS), 'white')
+    for (row_idx, col_idx), tile in zip(cells, tiles):
+        grid.paste(tile, (col_idx * tile_width, row_idx * tile_height))
     
-    # No overall title (removed as requested)
-    # Add extra padding to prevent label overlap (matching advisor's style)
-    plt.tight_layout(rect=[0.02, 0.02, 0.98, 0.98], pad=2.0)
-    save_path = os.path.join('fig5_plots', 'figure5_grid.png')
-    plt.savefig(save_path, dpi=300, bbox_inches='tight', pad_inches=0.2)
-    plt.close()
+    buf = io.BytesIO()
+    grid.save(buf, format='png', dpi=(GRID_DPI, GRID_DPI))
+    save_path = output_path('png')
+    write_output(save_path, buf.getvalue())
     
     return save_path
 
@@ -290,13 +434,36 @@ def main():
     """
     Generate Figure 5 as a grid layout.
     """
+    parser = argparse.ArgumentParser(description="Generate Figure 5 grid layout.")
+    parser.add_argument('--jobs', type=int, default=1,
+                        help="Render the grid as tiles in this many processes (0 = all CPUs). "
+                             "The default of 1 draws the grid as a single figure.")
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default=OUTPUT_FORMATS[0],
+                        help="Output format (default: %(default)s).")
+    parser.add_argument('--force', action='store_true',
+                        help="Render even if the existing figure is up to date.")
+    args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be >= 0")
+    jobs = args.jobs or os.cpu_count()
+    if jobs > 1 and args.format != 'png':
+        parser.error("--jobs renders PNG tiles; use it with --format png")
+    
+    key = config_hash(tiled=jobs > 1)
+    if not args.force and is_up_to_date(output_path(args.format), key):
+        print(f"Figure 5 grid is up to date: {output_path(args.format)}")
+        return
+    
     print("Generating Figure 5 grid layout...")
     print("=" * 60)
     
     try:
-        with tqdm(total=1, desc="Creating grid", unit="figure") as pbar:
-            save_path = create_figure5_grid()
-            pbar.update(1)
+        print("Rendering grid...")
+        if jobs > 1:
+            save_path = create_figure5_tiles(jobs)
+        else:
+            save_path = create_figure5_grid(args.format)
+        hash_path(save_path).write_text(key + '\n')
         
         print("\n" + "=" * 60)
         print(f"✓ Successfully generated Figure 5 grid: {save_path}")
@@ -308,6 +475,4 @@ def main():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    # Set random seed for reproducibility
-    np.random.seed(42)
     main()